@@ -1,16 +1,42 @@
 #!/usr/bin/env python3
 
-import json
+import asyncio
+import atexit
+import functools
 import hashlib
+import orjson
+import shutil
 import subprocess
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime
-from ecdsa import SigningKey, SECP256k1
-from ecdsa.util import sigencode_der
+from coincurve import PrivateKey
+
+try:
+    import aiohttp  # Optional: only needed for automatic cell collection
+except ImportError:
+    aiohttp = None
+
+# ==============================================================================
+# Timestamps
+# ==============================================================================
+
+# Wall-clock base taken once; later times are derived from the monotonic clock
+_T0_WALL = time.time()
+_T0_MONO = time.monotonic()
+
+def _now():
+    """Current wall-clock time in seconds (no datetime/tzinfo construction)"""
+    return _T0_WALL + (time.monotonic() - _T0_MONO)
+
+def _isoformat(timestamp):
+    """Format a timestamp like datetime.isoformat() (local time with microseconds)"""
+    micros = int(timestamp % 1 * 1_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(timestamp)) + f".{micros:06d}"
 
 # ==============================================================================
 # CONFIGURATION
@@ -49,11 +75,15 @@ SKIP_COMPILATION = False
 # Output configuration file path
 OUTPUT_CONFIG_PATH = "./votesecure_config.json"
 
+# On-disk cache for final RPC results (committed transactions, dead cells)
+RPC_CACHE_PATH = "./.rpc_cache.json"
+RPC_CACHE_MAX_ENTRIES = 256
+
 # Auto-sign and send transaction
 AUTO_DEPLOY = False  # Set to True only if you have working cell collection
 
 # Log file configuration
-LOG_FILE = f"deployment_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+LOG_FILE = f"deployment_log_{time.strftime('%Y%m%d_%H%M%S', time.localtime(_now()))}.log"
 
 # ==============================================================================
 # Logging Setup
@@ -68,9 +98,12 @@ class Logger:
         # Create log file with header
         with open(self.log_file, 'w', encoding='utf-8') as f:
             f.write(f"VoteSecure Lockscript Deployment Log\n")
-            f.write(f"Started: {datetime.now().isoformat()}\n")
+            f.write(f"Started: {_isoformat(_now())}\n")
             f.write("="*70 + "\n\n")
         
+        # Keep one line-buffered handle open instead of reopening per message
+        self._fh = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+        
     def write(self, message):
         # Write to console (handle encoding errors)
         try:
@@ -81,15 +114,26 @@ class Logger:
             self.terminal.write(clean_message)
         
         # Write to log file (UTF-8)
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(message)
+        self._fh.write(message)
     
     def flush(self):
         self.terminal.flush()
+        self._fh.flush()
+    
+    def close(self):
+        self._fh.close()
+
+def _close_loggers():
+    """Restore the real console streams, then close the log file handles"""
+    loggers = [stream for stream in (sys.stdout, sys.stderr) if isinstance(stream, Logger)]
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    for logger in loggers:
+        logger.close()
 
 # Set up logging
 sys.stdout = Logger(LOG_FILE)
 sys.stderr = Logger(LOG_FILE)
+atexit.register(_close_loggers)
 
 print(f"[INFO] Log file: {LOG_FILE}")
 
@@ -103,12 +147,17 @@ os.chdir(Path(__file__).parent)
 def _normalize_hex_key(s: str) -> str:
     s = s.strip()
     hex_part = s[2:] if s.startswith("0x") else s
-    if len(hex_part) != 64 or any(c not in "0123456789abcdefABCDEF" for c in hex_part):
+    try:
+        # bytes.fromhex validates in C; it skips whitespace, hence both length checks
+        valid = len(hex_part) == 64 and len(bytes.fromhex(hex_part)) == 32
+    except ValueError:
+        valid = False
+    if not valid:
         raise ValueError("wallet.txt line 1 must be a 32-byte hex key (64 hex chars).")
     return "0x" + hex_part.lower()
 
 def get_NEURON_WALLET_CONFIG(wallet_path):
-    json_key = json.loads(Path(wallet_path).read_text(encoding="utf-8"))
+    json_key = orjson.loads(Path(wallet_path).read_bytes())
     NEURON_WALLET_CONFIG = {
         "address": json_key["address"], 
         "private_key": _normalize_hex_key(json_key["rawprivatekey(hex)"])
@@ -122,15 +171,361 @@ NEURON_WALLET_CONFIG = get_NEURON_WALLET_CONFIG(wallet_path)
 # ==============================================================================
 
 
+# ==============================================================================
+# CKB Hashing & Molecule Serialization
+# ==============================================================================
+
+# CKB uses blake2b-256 with this personalization for code hashes and tx hashes
+CKB_HASH_PERSONALIZATION = b'ckb-default-hash'
+
+# Initialized once; hash sites take a copy() instead of redoing the personalized init
+_CKB_HASHER_TEMPLATE = hashlib.blake2b(digest_size=32, person=CKB_HASH_PERSONALIZATION)
+
+# Chunk size when streaming the lockscript binary (hashing, hex output)
+BINARY_CHUNK_SIZE = 64 * 1024
+
+# Recoverable secp256k1 signature: r (32) || s (32) || recovery id (1)
+SIGNATURE_SIZE = 65
+
+# Smallest capacity of a secp256k1 lock cell without data (61 CKB in shannons)
+MIN_CELL_CAPACITY = 61 * 100_000_000
+
+# CKB script hash_type and cell dep_type byte encodings
+HASH_TYPES = {"data": 0x00, "type": 0x01, "data1": 0x02, "data2": 0x04}
+DEP_TYPES = {"code": 0x00, "dep_group": 0x01}
+
+def _hex_to_bytes(value):
+    """Decode a 0x-prefixed hex string (raw bytes are passed through)"""
+    if isinstance(value, (bytes, bytearray)):
+        return value
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+def _json_default(value):
+    """JSON encoder hook: raw bytes (e.g. outputs_data) become 0x-prefixed hex"""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _write_transaction_json(transaction, path):
+    """
+    Write a transaction as 2-space indented JSON (same layout as orjson OPT_INDENT_2)
+    
+    Raw-bytes outputs_data entries are hex-encoded chunk by chunk straight into
+    the file, so no full hex copy of the binary is ever held in memory.
+    """
+    items = list(transaction.items())
+    with open(path, "wb") as f:
+        f.write(b"{\n")
+        for i, (key, value) in enumerate(items):
+            f.write(b"  " + orjson.dumps(key) + b": ")
+            if key == "outputs_data" and value:
+                f.write(b"[\n")
+                for j, data in enumerate(value):
+                    f.write(b'    "0x')
+                    if isinstance(data, (bytes, bytearray)):
+                        view = memoryview(data)
+                        for start in range(0, len(view), BINARY_CHUNK_SIZE):
+                            f.write(view[start:start + BINARY_CHUNK_SIZE].hex().encode("ascii"))
+                    else:
+                        f.write(data[2:].encode("ascii"))
+                    f.write(b'",\n' if j < len(value) - 1 else b'"\n')
+                f.write(b"  ]")
+            else:
+                # Small values: serialize normally and indent one level deeper
+                encoded = orjson.dumps(value, default=_json_default, option=orjson.OPT_INDENT_2)
+                f.write(encoded.replace(b"\n", b"\n  "))
+            f.write(b",\n" if i < len(items) - 1 else b"\n")
+        f.write(b"}")
+
+def _mol_uint(value, size):
+    """Molecule Uint32/Uint64: little-endian integer from a hex string"""
+    return int(value, 16).to_bytes(size, "little")
+
+def _mol_bytes(data):
+    """Molecule Bytes (fixvec<byte>): length header followed by the raw bytes"""
+    return len(data).to_bytes(4, "little") + data
+
+def _mol_fixvec(items):
+    """Molecule fixvec: item count followed by fixed-size items"""
+    return len(items).to_bytes(4, "little") + b"".join(items)
+
+def _mol_table(fields):
+    """Molecule table / dynvec: total size, field offsets, then the fields"""
+    offset = 4 * (len(fields) + 1)
+    offsets = []
+    for field in fields:
+        offsets.append(offset.to_bytes(4, "little"))
+        offset += len(field)
+    return offset.to_bytes(4, "little") + b"".join(offsets) + b"".join(fields)
+
+def _mol_script(script):
+    """Script table: code_hash, hash_type, args"""
+    return _mol_table([
+        _hex_to_bytes(script["code_hash"]),
+        bytes([HASH_TYPES[script["hash_type"]]]),
+        _mol_bytes(_hex_to_bytes(script["args"]))
+    ])
+
+def _mol_out_point(out_point):
+    """OutPoint struct: tx_hash, index"""
+    return _hex_to_bytes(out_point["tx_hash"]) + _mol_uint(out_point["index"], 4)
+
+def _mol_cell_output(output):
+    """CellOutput table: capacity, lock, type (ScriptOpt)"""
+    type_script = output.get("type")
+    return _mol_table([
+        _mol_uint(output["capacity"], 8),
+        _mol_script(output["lock"]),
+        _mol_script(type_script) if type_script else b""
+    ])
+
+def molecule_encode_witness_args(lock=None, input_type=None, output_type=None):
+    """Serialize WitnessArgs (each field is BytesOpt: None leaves it empty)"""
+    return _mol_table([
+        _mol_bytes(field) if field is not None else b""
+        for field in (lock, input_type, output_type)
+    ])
+
+def molecule_encode_raw_tx(transaction):
+    """
+    Serialize the RawTransaction part of a JSON-RPC transaction with Molecule
+    
+    This is the byte layout CKB hashes to get the transaction hash (witnesses excluded)
+    """
+    return _mol_table([
+        _mol_uint(transaction["version"], 4),
+        _mol_fixvec([
+            _mol_out_point(dep["out_point"]) + bytes([DEP_TYPES[dep["dep_type"]]])
+            for dep in transaction["cell_deps"]
+        ]),
+        _mol_fixvec([_hex_to_bytes(h) for h in transaction["header_deps"]]),
+        _mol_fixvec([
+            _mol_uint(cell_input["since"], 8) + _mol_out_point(cell_input["previous_output"])
+            for cell_input in transaction["inputs"]
+        ]),
+        _mol_table([_mol_cell_output(output) for output in transaction["outputs"]]),
+        _mol_table([_mol_bytes(_hex_to_bytes(data)) for data in transaction["outputs_data"]])
+    ])
+
+
+# ==============================================================================
+# CKB Address Decoding
+# ==============================================================================
+
+# Maps bech32 5-bit values (0-31) to base-32 digits understood by int()
+_BASE32_DIGITS = bytes.maketrans(bytes(range(32)), b"0123456789abcdefghijklmnopqrstuv")
+
+def _convertbits_5to8(data):
+    """
+    Regroup bech32 5-bit values into bytes (no padding allowed, None if invalid)
+    
+    All groups are packed into one big int and split with int.to_bytes instead of
+    shifting an accumulator in a Python loop.
+    """
+    nbits = 5 * len(data)
+    padding = nbits % 8
+    value = int(bytes(data).translate(_BASE32_DIGITS), 32) if data else 0
+    if padding >= 5 or value & ((1 << padding) - 1):
+        return None
+    return (value >> padding).to_bytes(nbits // 8, "big")
+
+_BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_BECH32_GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+
+# Checksum constants: full-format CKB addresses use bech32m, older formats bech32
+BECH32_CONST = 1
+BECH32M_CONST = 0x2bc830a3
+
+# SECP256K1 Blake160 lock (code hash index 0x00 of the short address format)
+SECP256K1_BLAKE160_CODE_HASH = "0x9bd7e06f3ecf4be0f2fcd2188b23f1b9fcc88e5d4b65a8637b17723bbda3cce8"
+
+def _bech32_polymod(values):
+    """BCH checksum over 5-bit values (BIP-173 / BIP-350)"""
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            if (top >> i) & 1:
+                checksum ^= _BECH32_GENERATOR[i]
+    return checksum
+
+def _bech32_decode(address):
+    """
+    Decode a bech32 or bech32m string to (hrp, 5-bit data, checksum constant)
+    
+    No 90-character limit: full-format CKB addresses are longer.
+    """
+    if address.lower() != address and address.upper() != address:
+        raise ValueError("Invalid bech32 address (mixed case)")
+    address = address.lower()
+    
+    separator = address.rfind("1")
+    if separator < 1 or separator + 7 > len(address):
+        raise ValueError("Invalid bech32 address")
+    
+    hrp = address[:separator]
+    data = [_BECH32_CHARSET.find(c) for c in address[separator + 1:]]
+    if -1 in data:
+        raise ValueError("Invalid bech32 address (bad character)")
+    
+    hrp_expanded = [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+    const = _bech32_polymod(hrp_expanded + data)
+    if const not in (BECH32_CONST, BECH32M_CONST):
+        raise ValueError("Invalid bech32 address (checksum)")
+    
+    return hrp, data[:-6], const
+
+@functools.lru_cache(maxsize=8)
+def _decode_ckb_address(address):
+    """Decode a CKB address to (code_hash, hash_type, args)"""
+    hrp, data, const = _bech32_decode(address)
+    
+    expected_hrp = "ckb" if USE_MAINNET else "ckt"
+    if hrp != expected_hrp:
+        raise ValueError(f"Address prefix '{hrp}' does not match {NETWORK} ('{expected_hrp}')")
+    
+    # Convert 5-bit groups to 8-bit groups
+    payload = _convertbits_5to8(data)
+    if not payload:
+        raise ValueError("Invalid address data")
+    
+    # Parse CKB address format
+    # Format byte + code hash + hash type + args
+    format_type = payload[0]
+    
+    if format_type == 0x00 and const == BECH32M_CONST:
+        # Full format: code_hash, hash_type byte, args
+        hash_types = {value: name for name, value in HASH_TYPES.items()}
+        if len(payload) < 34 or payload[33] not in hash_types:
+            raise ValueError("Invalid full-format address payload")
+        return "0x" + payload[1:33].hex(), hash_types[payload[33]], "0x" + payload[34:].hex()
+    
+    if const != BECH32_CONST:
+        raise ValueError(f"Address format 0x{format_type:02x} must use bech32, not bech32m")
+    
+    if format_type == 0x01:
+        # Short format (deprecated): code hash index + args
+        if payload[1] != 0x00:
+            raise ValueError(f"Unsupported short address code hash index 0x{payload[1]:02x}")
+        return SECP256K1_BLAKE160_CODE_HASH, "type", "0x" + payload[2:].hex()
+    
+    if format_type in (0x02, 0x04) and len(payload) >= 33:
+        # Full format (deprecated): code_hash, args; hash type given by the format byte
+        hash_type = "data" if format_type == 0x02 else "type"
+        return "0x" + payload[1:33].hex(), hash_type, "0x" + payload[33:].hex()
+    
+    raise ValueError(f"Unsupported address format 0x{format_type:02x}")
+
+
+def _build_batch_payload(client, requests_list):
+    """Build a JSON-RPC batch payload from (method, params) tuples"""
+    payload = []
+    for method, params in requests_list:
+        client.request_id += 1
+        payload.append({
+            "id": client.request_id,
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or []
+        })
+    return payload
+
+def _demux_batch_response(payload, responses):
+    """Match JSON-RPC batch responses (in any order) back to their requests by id"""
+    if isinstance(responses, dict):
+        # The whole batch was rejected
+        raise Exception(f"RPC Error: {responses.get('error', responses)}")
+    
+    by_id = {response.get("id"): response for response in responses}
+    results = []
+    for request in payload:
+        response = by_id.get(request["id"])
+        if response is None:
+            raise Exception(f"RPC Error: no response for {request['method']} (id {request['id']})")
+        if "error" in response:
+            raise Exception(f"RPC Error: {response['error']}")
+        results.append(response.get("result"))
+    
+    return results
+
+
 class CKBRPCClient:
     """Simple CKB RPC client for interacting with CKB node"""
     
-    def __init__(self, rpc_url):
+    # Methods whose results can be cached once they are final (see _is_cacheable
+    # and _is_final). Results are cached unchanged, so a hit has the same shape as a miss
+    CACHEABLE_METHODS = {"get_live_cell", "get_transaction"}
+    
+    def __init__(self, rpc_url, cache_path=RPC_CACHE_PATH):
         self.rpc_url = rpc_url
         self.request_id = 0
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache = self._load_cache()
+        
+        # Reuse connections (keep-alive, TLS resumption) across RPC calls
+        self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def _load_cache(self):
+        """Load cached RPC results from disk (LRU order, oldest first)"""
+        if self.cache_path and self.cache_path.exists():
+            try:
+                return OrderedDict(orjson.loads(self.cache_path.read_bytes()))
+            except (OSError, ValueError) as e:
+                print(f"[WARNING] Ignoring unreadable RPC cache {self.cache_path}: {e}")
+        return OrderedDict()
+    
+    def _store_in_cache(self, cache_key, result):
+        """Add a final result to the cache, evict the least recently used and persist"""
+        self.cache[cache_key] = result
+        while len(self.cache) > RPC_CACHE_MAX_ENTRIES:
+            self.cache.popitem(last=False)
+        
+        if self.cache_path:
+            try:
+                self.cache_path.write_bytes(orjson.dumps(self.cache))
+            except OSError as e:
+                print(f"[WARNING] Could not write RPC cache {self.cache_path}: {e}")
+    
+    @classmethod
+    def _is_cacheable(cls, method, params):
+        """
+        Only small results are cached: get_transaction just at verbosity 0x1
+        (status only, transaction is null), never the full multi-MB transaction
+        """
+        if method not in cls.CACHEABLE_METHODS:
+            return False
+        if method == "get_transaction":
+            return len(params) > 1 and params[1] == "0x1"
+        return True
+    
+    @staticmethod
+    def _is_final(method, result):
+        """A committed transaction or a consumed cell never changes again"""
+        if not result:
+            return False
+        if method == "get_transaction":
+            return (result.get("tx_status") or {}).get("status") == "committed"
+        if method == "get_live_cell":
+            # A dead cell's result carries no cell data ("cell": null), so it stays small
+            return result.get("status") == "dead"
+        return False
     
     def call(self, method, params=None):
         """Make RPC call to CKB node"""
+        cache_key = None
+        if self._is_cacheable(method, params or []):
+            # Keyed by node URL too, so switching network never serves another chain's result
+            params_json = orjson.dumps(params or [], option=orjson.OPT_SORT_KEYS).decode()
+            cache_key = f"{self.rpc_url}|{method}:{params_json}"
+            if cache_key in self.cache:
+                self.cache.move_to_end(cache_key)
+                return self.cache[cache_key]
+        
         self.request_id += 1
         
         payload = {
@@ -140,16 +535,32 @@ class CKBRPCClient:
             "params": params or []
         }
         
-        response = requests.post(self.rpc_url, json=payload)
+        response = self.session.post(self.rpc_url, data=orjson.dumps(payload, default=_json_default))
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         
         if "error" in result:
             raise Exception(f"RPC Error: {result['error']}")
         
+        if cache_key and self._is_final(method, result.get("result")):
+            self._store_in_cache(cache_key, result["result"])
+        
         return result.get("result")
     
+    def batch_call(self, requests_list):
+        """
+        Make several RPC calls in one JSON-RPC batch request
+        
+        requests_list holds (method, params) tuples; results come back in the same order
+        """
+        payload = _build_batch_payload(self, requests_list)
+        
+        response = self.session.post(self.rpc_url, data=orjson.dumps(payload, default=_json_default))
+        response.raise_for_status()
+        
+        return _demux_batch_response(payload, orjson.loads(response.content))
+    
     def get_tip_header(self):
         """Get current blockchain tip header"""
         return self.call("get_tip_header")
@@ -166,6 +577,10 @@ class CKBRPCClient:
         """Get transaction by hash"""
         return self.call("get_transaction", [tx_hash])
     
+    def get_transaction_status(self, tx_hash):
+        """Get only the tx_status of a transaction (verbosity 0x1: transaction is null)"""
+        return self.call("get_transaction", [tx_hash, "0x1"])
+    
     def get_cells(self, search_key, order="asc", limit="0x64"):
         """Get cells using indexer"""
         indexer_url = INDEXER_URL
@@ -176,16 +591,88 @@ class CKBRPCClient:
             "params": [search_key, order, limit]
         }
         
-        response = requests.post(indexer_url, json=payload)
+        response = self.session.post(indexer_url, data=orjson.dumps(payload))
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         if "error" in result:
             raise Exception(f"Indexer Error: {result['error']}")
         
         return result.get("result")
 
 
+class AsyncCKBRPCClient:
+    """Asynchronous CKB RPC client (aiohttp) for issuing queries concurrently"""
+    
+    def __init__(self, rpc_url, indexer_url=INDEXER_URL):
+        self.rpc_url = rpc_url
+        self.indexer_url = indexer_url
+        self.request_id = 0
+        self.session = None
+    
+    async def __aenter__(self):
+        if aiohttp is None:
+            raise ImportError("aiohttp library not found (pip install aiohttp)")
+        self.session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+    
+    async def call(self, method, params=None, url=None):
+        """Make RPC call to CKB node (or to the indexer when url is given)"""
+        self.request_id += 1
+        
+        payload = {
+            "id": self.request_id,
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or []
+        }
+        
+        async with self.session.post(url or self.rpc_url, data=orjson.dumps(payload, default=_json_default)) as response:
+            response.raise_for_status()
+            result = orjson.loads(await response.read())
+        
+        if "error" in result:
+            raise Exception(f"RPC Error: {result['error']}")
+        
+        return result.get("result")
+    
+    async def batch_call(self, requests_list):
+        """
+        Make several RPC calls in one JSON-RPC batch request
+        
+        requests_list holds (method, params) tuples; results come back in the same order
+        """
+        payload = _build_batch_payload(self, requests_list)
+        
+        async with self.session.post(self.rpc_url, data=orjson.dumps(payload, default=_json_default)) as response:
+            response.raise_for_status()
+            responses = orjson.loads(await response.read())
+        
+        return _demux_batch_response(payload, responses)
+    
+    async def get_tip_header(self):
+        """Get current blockchain tip header"""
+        return await self.call("get_tip_header")
+    
+    async def get_live_cell(self, out_point, with_data=True):
+        """Get live cell by out_point"""
+        return await self.call("get_live_cell", [out_point, with_data])
+    
+    async def get_transaction(self, tx_hash):
+        """Get transaction by hash"""
+        return await self.call("get_transaction", [tx_hash])
+    
+    async def get_cells(self, search_key, order="asc", limit="0x64", cursor=None):
+        """Get one page of cells using indexer (pass the previous page's last_cursor to continue)"""
+        params = [search_key, order, limit]
+        if cursor:
+            params.append(cursor)
+        return await self.call("get_cells", params, url=self.indexer_url)
+
+
 class VoteSecureDeployer:
     """Handles deployment of VoteSecure lockscript to CKB blockchain"""
     
@@ -194,6 +681,9 @@ class VoteSecureDeployer:
         self.address = NEURON_WALLET_CONFIG["address"]
         self.private_key = NEURON_WALLET_CONFIG["private_key"]
         
+        # Build the libsecp256k1 signing key once and reuse it for every signature
+        self._signer = PrivateKey(bytes.fromhex(self.private_key[2:]))
+        
         print("="*70)
         print("VoteSecure Lockscript Deployment")
         print("="*70)
@@ -242,8 +732,7 @@ class VoteSecureDeployer:
         binary_path = Path(LOCKSCRIPT_BINARY_PATH)
         if binary_path.exists():
             print(f"[OK] Using existing binary: {binary_path}")
-            with open(binary_path, "rb") as f:
-                return f.read()
+            return binary_path
         
         # Try to compile
         print("[WARNING] No pre-compiled binary found. Attempting to compile...")
@@ -257,16 +746,29 @@ class VoteSecureDeployer:
                 "Please ensure the Rust contract source is in ./contract/"
             )
         
-        # Compile with cargo
-        print("Running: cargo build --release --target=riscv64imac-unknown-none-elf")
+        # Compile with cargo, using all cores
+        cargo_args = [
+            "cargo", "build",
+            "--release",
+            "-j", str(os.cpu_count() or 1),
+            "--target=riscv64imac-unknown-none-elf"
+        ]
+        
+        # Use sccache as compiler cache when installed; it cannot cache incremental
+        # builds, so incremental stays off. RUSTFLAGS stays untouched:
+        # target-cpu=native would break the RISC-V cross-compile
+        env = dict(os.environ)
+        if shutil.which("sccache"):
+            env["RUSTC_WRAPPER"] = "sccache"
+            env["CARGO_INCREMENTAL"] = "0"
+            print("[INFO] Using sccache as RUSTC_WRAPPER")
+        
+        print(f"Running: {' '.join(cargo_args)}")
         
         result = subprocess.run(
-            [
-                "cargo", "build",
-                "--release",
-                "--target=riscv64imac-unknown-none-elf"
-            ],
+            cargo_args,
             cwd=contract_dir,
+            env=env,
             capture_output=True,
             text=True
         )
@@ -276,43 +778,47 @@ class VoteSecureDeployer:
         
         print(f"[OK] Compilation successful")
         
-        # Read compiled binary
+        # Locate compiled binary
         compiled_path = contract_dir / "target/riscv64imac-unknown-none-elf/release/votesecure-lockscript"
         if not compiled_path.exists():
             raise FileNotFoundError(f"[ERROR] Compiled binary not found at {compiled_path}")
         
-        with open(compiled_path, "rb") as f:
-            binary = f.read()
-        
-        print(f"[OK] Binary loaded ({len(binary)} bytes)")
+        print(f"[OK] Binary found ({compiled_path.stat().st_size} bytes)")
         
-        return binary
+        return compiled_path
     
-    def calculate_code_hash(self, binary):
+    def calculate_code_hash_from_path(self, binary_path):
         """
-        Calculate CKB code hash for the binary
+        Calculate CKB code hash for the binary file
         
-        CKB uses blake2b-256 with a specific personalization string
+        CKB uses blake2b-256 with a specific personalization string.
+        The file is hashed in chunks so the binary is never held in memory.
         """
         print("\n[*] Calculating code hash...")
         
         # CKB uses blake2b with 32-byte digest and specific personalization
-        hasher = hashlib.blake2b(digest_size=32, person=b'ckb-default-hash')
-        hasher.update(binary)
+        hasher = _CKB_HASHER_TEMPLATE.copy()
+        
+        # Read straight into one reusable buffer (unbuffered file, no per-chunk bytes objects)
+        buffer = bytearray(BINARY_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(binary_path, "rb", buffering=0) as f:
+            while size := f.readinto(buffer):
+                hasher.update(view[:size])
         code_hash = "0x" + hasher.hexdigest()
         
         print(f"[OK] Code Hash: {code_hash}")
         
         return code_hash
     
-    def calculate_required_capacity(self, binary):
+    def calculate_required_capacity(self, binary_size):
         """
         Calculate required CKB capacity for the lockscript cell
         
         Formula: 61 CKB (minimum) + data size + buffer
         """
         # Convert binary size from bytes to CKB (1 CKB = 100,000,000 shannons)
-        binary_size_ckb = len(binary) / 100_000_000
+        binary_size_ckb = binary_size / 100_000_000
         
         # Minimum cell capacity is 61 CKB
         # Add binary size and 10 CKB buffer for safety
@@ -322,7 +828,7 @@ class VoteSecureDeployer:
         required_shannons = int(required_ckb * 100_000_000)
         
         print(f"\n[*] Capacity Calculation:")
-        print(f"   Binary size: {len(binary)} bytes ({binary_size_ckb:.4f} CKB)")
+        print(f"   Binary size: {binary_size} bytes ({binary_size_ckb:.4f} CKB)")
         print(f"   Minimum: 61 CKB")
         print(f"   Buffer: 10 CKB")
         print(f"   Total required: {required_ckb:.2f} CKB ({required_shannons} shannons)")
@@ -342,115 +848,126 @@ class VoteSecureDeployer:
         }
     
     def address_to_script(self, address):
-        """Convert CKB address to script using bech32 decoding"""
+        """Convert CKB address to script (bech32 / bech32m decoding)"""
         try:
             # CKB addresses use bech32 encoding
             # For testnet: ckt1... For mainnet: ckb1...
+            # Decoding is memoized, repeated lookups of the deployer address are free
+            code_hash, hash_type, args = _decode_ckb_address(address)
+            
+            return {
+                "code_hash": code_hash,
+                "hash_type": hash_type,
+                "args": args
+            }
             
-            # Import bech32 if available, otherwise use simplified approach
-            try:
-                import bech32
-                hrp, data = bech32.bech32_decode(address)
-                if data is None:
-                    raise ValueError("Invalid bech32 address")
-                
-                # Convert 5-bit groups to 8-bit groups
-                decoded = bech32.convertbits(data, 5, 8, False)
-                if decoded is None:
-                    raise ValueError("Invalid address data")
-                
-                # Extract payload
-                payload = bytes(decoded)
-                
-                # Parse CKB address format
-                # Format byte + code hash + args
-                format_type = payload[0]
-                code_hash_index = payload[1]
-                
-                # For standard addresses
-                if format_type == 0x01:  # Short format with code hash index
-                    # SECP256K1 Blake160 lock
-                    code_hash = "0x9bd7e06f3ecf4be0f2fcd2188b23f1b9fcc88e5d4b65a8637b17723bbda3cce8"
-                    hash_type = "type"
-                    args = "0x" + payload[2:].hex()
-                else:
-                    # Full format
-                    code_hash = "0x" + payload[1:33].hex()
-                    hash_type = "data" if payload[33] == 0 else "type"
-                    args = "0x" + payload[34:].hex()
-                
-                return {
-                    "code_hash": code_hash,
-                    "hash_type": hash_type,
-                    "args": args
-                }
-                
-            except ImportError:
-                # Fallback: Manual parsing without bech32 library
-                print("[WARNING] bech32 library not found, using simplified address parsing")
-                
-                # For testnet addresses starting with ckt1
-                # Standard format: use SECP256K1 Blake160
-                return {
-                    "code_hash": "0x9bd7e06f3ecf4be0f2fcd2188b23f1b9fcc88e5d4b65a8637b17723bbda3cce8",
-                    "hash_type": "type",
-                    "args": "0x" + "00" * 20  # Placeholder - will query all cells
-                }
-                
         except Exception as e:
             print(f"[ERROR] Failed to parse address: {e}")
             raise
     
+    async def _collect_live_cells(self, lock_script, target_capacity):
+        """
+        Page through the indexer for plain CKB cells of lock_script until
+        target_capacity is covered, then confirm they are still live
+        """
+        # Only spend cells without type script and without data
+        search_key = {
+            "script": lock_script,
+            "script_type": "lock",
+            "filter": {
+                "script_len_range": ["0x0", "0x1"],
+                "output_data_len_range": ["0x0", "0x1"]
+            }
+        }
+        
+        cells = []
+        capacity = 0
+        
+        async with AsyncCKBRPCClient(RPC_URL) as client:
+            # Indexer pagination is cursor based, so pages are fetched in sequence
+            cursor = None
+            while capacity < target_capacity:
+                page = await client.get_cells(search_key, cursor=cursor)
+                for cell in page["objects"]:
+                    cells.append(cell)
+                    capacity += int(cell["output"]["capacity"], 16)
+                    if capacity >= target_capacity:
+                        break
+                if not page["objects"]:
+                    break
+                cursor = page["last_cursor"]
+            
+            if capacity < target_capacity:
+                raise Exception(
+                    f"Insufficient capacity: found {capacity / 100000000:.2f} CKB, "
+                    f"need {target_capacity / 100000000:.2f} CKB"
+                )
+            
+            # The indexer may lag behind the node: check all cells in one batch round trip
+            live_cells = await client.batch_call([
+                ("get_live_cell", [cell["out_point"], False]) for cell in cells
+            ])
+        
+        if any(live_cell["status"] != "live" for live_cell in live_cells):
+            raise Exception("Indexed cells are no longer live, please retry")
+        
+        inputs = [
+            {"previous_output": cell["out_point"], "since": "0x0"}
+            for cell in cells
+        ]
+        
+        return inputs, capacity
+    
     def collect_inputs(self, address, required_capacity):
         """Collect input cells from address to meet required capacity"""
         print(f"\n[*] Collecting {required_capacity / 100000000:.2f} CKB from {address[:20]}...")
         
-        # For simplified approach, query using RPC directly instead of indexer
-        # Use get_cells_by_lock_hash
-        
         try:
-            # Alternative approach: Use RPC method to get cells
-            # This is more reliable than indexer for simple queries
-            
-            print("[INFO] Querying cells from address...")
-            
-            # Build a simpler query - just get capacity info from the node
-            # We'll use a workaround: query tip and construct transaction manually
+            print("[INFO] Querying cells from indexer...")
             
-            # For now, create a simplified transaction without collecting real inputs
-            # This will be a placeholder that needs manual completion
+            lock_script = self.address_to_script(address)
             
-            print("[WARNING] Automatic cell collection not available")
-            print("[INFO] Creating transaction template...")
-            
-            # Return placeholder inputs
-            # User will need to fill these manually or use Neuron wallet
-            placeholder_input = {
-                "previous_output": {
-                    "tx_hash": "0x0000000000000000000000000000000000000000000000000000000000000000",
-                    "index": "0x0"
-                },
-                "since": "0x0"
-            }
-            
-            lock_script = {
-                "code_hash": "0x9bd7e06f3ecf4be0f2fcd2188b23f1b9fcc88e5d4b65a8637b17723bbda3cce8",
-                "hash_type": "type",
-                "args": "0x" + "00" * 20
-            }
-            
-            # Calculate a reasonable input capacity (required + buffer)
-            input_capacity = required_capacity + 200000000  # +2 CKB for change and fee
+            # Cover the lockscript cell, a minimum-size change cell and the fee
+            target_capacity = required_capacity + MIN_CELL_CAPACITY + 1000
+            inputs, input_capacity = asyncio.run(
+                self._collect_live_cells(lock_script, target_capacity)
+            )
             
-            print(f"[INFO] Template created with estimated capacity: {input_capacity / 100000000:.2f} CKB")
-            print(f"[WARNING] You will need to manually specify inputs using Neuron or ckb-cli")
+            print(f"[OK] Collected {len(inputs)} cells ({input_capacity / 100000000:.2f} CKB)")
             
-            return [placeholder_input], input_capacity, lock_script
+            return inputs, input_capacity, lock_script
             
         except Exception as e:
-            raise Exception(f"Failed to collect inputs: {e}")
+            print(f"[WARNING] Automatic cell collection not available: {e}")
+        
+        # Fall back to a template that needs manual completion
+        print("[INFO] Creating transaction template...")
+        
+        # Return placeholder inputs
+        # User will need to fill these manually or use Neuron wallet
+        placeholder_input = {
+            "previous_output": {
+                "tx_hash": "0x0000000000000000000000000000000000000000000000000000000000000000",
+                "index": "0x0"
+            },
+            "since": "0x0"
+        }
+        
+        lock_script = {
+            "code_hash": SECP256K1_BLAKE160_CODE_HASH,
+            "hash_type": "type",
+            "args": "0x" + "00" * 20
+        }
+        
+        # Calculate a reasonable input capacity (required + buffer)
+        input_capacity = required_capacity + 200000000  # +2 CKB for change and fee
+        
+        print(f"[INFO] Template created with estimated capacity: {input_capacity / 100000000:.2f} CKB")
+        print(f"[WARNING] You will need to manually specify inputs using Neuron or ckb-cli")
+        
+        return [placeholder_input], input_capacity, lock_script
     
-    def build_deployment_transaction(self, binary, required_capacity):
+    def build_deployment_transaction(self, binary_path, required_capacity):
         """
         Build transaction to deploy lockscript to blockchain
         """
@@ -466,8 +983,9 @@ class VoteSecureDeployer:
             "type": None
         }
         
-        # Encode binary as hex string for output data
-        binary_hex = "0x" + binary.hex()
+        # Keep the binary as raw bytes: it is hex-encoded only when the
+        # transaction is written as JSON, and hashed as-is
+        binary = Path(binary_path).read_bytes()
         
         # Calculate change
         fee = 1000  # 0.00001 CKB fee
@@ -499,7 +1017,7 @@ class VoteSecureDeployer:
                 change_output
             ],
             "outputs_data": [
-                binary_hex,
+                binary,
                 "0x"
             ],
             "witnesses": []
@@ -515,7 +1033,10 @@ class VoteSecureDeployer:
     
     def sign_transaction(self, transaction):
         """
-        Sign transaction with private key using secp256k1
+        Sign transaction with private key using secp256k1 (sighash-all)
+        
+        All inputs use the deployer's lock and form one script group: the first
+        witness carries the signature, the other witnesses of the group stay empty.
         """
         print("\n[*] Signing transaction...")
         
@@ -523,40 +1044,47 @@ class VoteSecureDeployer:
         tx_hash = self.calculate_transaction_hash(transaction)
         print(f"   Transaction hash: {tx_hash}")
         
-        # Sign with private key
-        private_key_bytes = bytes.fromhex(self.private_key[2:])
-        sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
+        # The first witness is signed with a zero-filled lock, encoded once
+        placeholder = molecule_encode_witness_args(lock=bytes(SIGNATURE_SIZE))
+        witnesses = [placeholder] + [b""] * (len(transaction["inputs"]) - 1)
         
-        # Sign the transaction hash
-        signature = sk.sign_digest(bytes.fromhex(tx_hash[2:]), sigencode=sigencode_der)
+        # Sign with libsecp256k1 (recoverable r || s || v, as CKB expects)
+        message = self.calculate_signing_message(tx_hash, witnesses)
+        signature = self._signer.sign_recoverable(message, hasher=None)
         
-        # Create witness
-        witness = {
-            "lock": "0x" + signature.hex(),
-            "input_type": "",
-            "output_type": ""
-        }
-        
-        # Add witness for each input
-        transaction["witnesses"] = [self.serialize_witness(witness)] * len(transaction["inputs"])
+        # Put the signature into the first witness
+        witnesses[0] = molecule_encode_witness_args(lock=signature)
+        transaction["witnesses"] = ["0x" + witness.hex() for witness in witnesses]
         
         print(f"[OK] Transaction signed")
         
         return transaction
     
     def calculate_transaction_hash(self, transaction):
-        """Calculate transaction hash for signing"""
-        import json
-        tx_json = json.dumps(transaction, sort_keys=True)
+        """
+        Calculate transaction hash for signing
         
-        hasher = hashlib.blake2b(digest_size=32, person=b'ckb-default-hash')
-        hasher.update(tx_json.encode())
+        CKB hashes the Molecule-serialized RawTransaction with blake2b-256
+        """
+        hasher = _CKB_HASHER_TEMPLATE.copy()
+        hasher.update(molecule_encode_raw_tx(transaction))
         
         return "0x" + hasher.hexdigest()
     
-    def serialize_witness(self, witness):
-        """Serialize witness to hex string"""
-        return witness["lock"]
+    def calculate_signing_message(self, tx_hash, witnesses):
+        """
+        Calculate the sighash-all message for a script group
+        
+        blake2b-256 over the tx hash, then each witness (raw bytes) prefixed
+        with its length as little-endian u64
+        """
+        hasher = _CKB_HASHER_TEMPLATE.copy()
+        hasher.update(bytes.fromhex(tx_hash[2:]))
+        for witness in witnesses:
+            hasher.update(len(witness).to_bytes(8, "little"))
+            hasher.update(witness)
+        
+        return hasher.digest()
     
     def send_transaction(self, signed_tx):
         """
@@ -582,7 +1110,7 @@ class VoteSecureDeployer:
         
         while time.time() - start_time < timeout:
             try:
-                tx_status = self.rpc.get_transaction(tx_hash)
+                tx_status = self.rpc.get_transaction_status(tx_hash)
                 
                 if tx_status and tx_status.get("tx_status"):
                     status = tx_status["tx_status"]["status"]
@@ -601,7 +1129,7 @@ class VoteSecureDeployer:
         
         raise TimeoutError("[ERROR] Transaction confirmation timeout")
     
-    def save_configuration(self, code_hash, tx_hash, binary, required_capacity):
+    def save_configuration(self, code_hash, tx_hash, binary_size, required_capacity):
         """
         Save deployment configuration to JSON file
         """
@@ -616,10 +1144,10 @@ class VoteSecureDeployer:
                     "tx_hash": tx_hash,
                     "index": "0x0"
                 },
-                "deployed_at": datetime.now().isoformat(),
+                "deployed_at": _isoformat(_now()),
                 "deployed_by": self.address,
                 "network": NETWORK,
-                "binary_size_bytes": len(binary),
+                "binary_size_bytes": binary_size,
                 "capacity_shannons": required_capacity,
                 "capacity_ckb": required_capacity / 100_000_000,
                 "rpc_url": RPC_URL,
@@ -634,8 +1162,7 @@ class VoteSecureDeployer:
         
         config_path = Path(OUTPUT_CONFIG_PATH)
         
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
         
         print(f"[OK] Configuration saved to: {config_path}")
         
@@ -650,21 +1177,21 @@ class VoteSecureDeployer:
             self.validate_configuration()
             
             # Step 2: Get lockscript binary
-            binary = self.compile_lockscript()
+            binary_path = self.compile_lockscript()
+            binary_size = binary_path.stat().st_size
             
             # Step 3: Calculate code hash
-            code_hash = self.calculate_code_hash(binary)
+            code_hash = self.calculate_code_hash_from_path(binary_path)
             
             # Step 4: Calculate required capacity
-            required_capacity = self.calculate_required_capacity(binary)
+            required_capacity = self.calculate_required_capacity(binary_size)
             
             # Step 5: Build transaction
-            transaction = self.build_deployment_transaction(binary, required_capacity)
+            transaction = self.build_deployment_transaction(binary_path, required_capacity)
             
             # Save transaction for reference
             tx_file_path = "./deployment_transaction.json"
-            with open(tx_file_path, "w") as f:
-                json.dump(transaction, f, indent=2)
+            _write_transaction_json(transaction, tx_file_path)
             print(f"\n[INFO] Transaction saved to: {tx_file_path}")
             
             if AUTO_DEPLOY:
@@ -682,7 +1209,7 @@ class VoteSecureDeployer:
                 self.wait_for_confirmation(tx_hash)
                 
                 # Step 9: Save configuration
-                config = self.save_configuration(code_hash, tx_hash, binary, required_capacity)
+                config = self.save_configuration(code_hash, tx_hash, binary_size, required_capacity)
                 
                 # Print summary
                 self.print_deployment_summary(code_hash, tx_hash, config)
@@ -712,7 +1239,7 @@ class VoteSecureDeployer:
                 print("     python VoteSecure_create_lockscript_cell.py --finalize <tx_hash>")
                 
                 # Save configuration (with placeholder tx_hash)
-                config = self.save_configuration(code_hash, tx_hash, binary, required_capacity)
+                config = self.save_configuration(code_hash, tx_hash, binary_size, required_capacity)
                 
                 # Print summary
                 self.print_deployment_summary(code_hash, tx_hash, config)
@@ -723,6 +1250,28 @@ class VoteSecureDeployer:
             traceback.print_exc()
             raise
     
+    def load_saved_configuration(self, binary_path):
+        """
+        Load the lockscript entry written by save_configuration
+        
+        Returns None when there is no saved configuration or it does not
+        match the current binary (different size or binary modified later).
+        """
+        config_path = Path(OUTPUT_CONFIG_PATH)
+        if not config_path.exists():
+            return None
+        
+        try:
+            saved = orjson.loads(config_path.read_bytes())["votesecure_lockscript"]
+            binary_stat = binary_path.stat()
+            if (saved["binary_size_bytes"] != binary_stat.st_size
+                    or binary_stat.st_mtime > config_path.stat().st_mtime):
+                return None
+            return saved
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[WARNING] Ignoring saved configuration {config_path}: {e}")
+            return None
+    
     def finalize_deployment(self, tx_hash):
         """
         Finalize deployment after transaction is confirmed
@@ -732,16 +1281,20 @@ class VoteSecureDeployer:
         # Wait for confirmation
         self.wait_for_confirmation(tx_hash)
         
-        # Get transaction details
-        tx_details = self.rpc.get_transaction(tx_hash)
-        
-        # Reload binary to get code hash
-        binary = self.compile_lockscript()
-        code_hash = self.calculate_code_hash(binary)
-        required_capacity = self.calculate_required_capacity(binary)
+        # Reuse code hash and capacity saved by deploy(), re-hash the binary only without them
+        binary_path = self.compile_lockscript()
+        binary_size = binary_path.stat().st_size
+        saved = self.load_saved_configuration(binary_path)
+        if saved:
+            code_hash = saved["code_hash"]
+            required_capacity = saved["capacity_shannons"]
+            print(f"[OK] Reusing code hash from {OUTPUT_CONFIG_PATH}: {code_hash}")
+        else:
+            code_hash = self.calculate_code_hash_from_path(binary_path)
+            required_capacity = self.calculate_required_capacity(binary_size)
         
         # Save final configuration
-        config = self.save_configuration(code_hash, tx_hash, binary, required_capacity)
+        config = self.save_configuration(code_hash, tx_hash, binary_size, required_capacity)
         
         # Print summary
         self.print_deployment_summary(code_hash, tx_hash, config)
@@ -779,8 +1332,6 @@ class VoteSecureDeployer:
 
 def main():
     """Main entry point"""
-    import sys
-    
     deployer = VoteSecureDeployer()
     
     # Check if finalizing existing deployment